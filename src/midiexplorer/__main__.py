@@ -39,6 +39,9 @@ def main() -> None:
         while not midi_in_queue.empty():
             midiexplorer.gui.windows.conn.handle_received_data(*midi_in_queue.get())
 
+        # Update history scrolling
+        midiexplorer.gui.windows.hist.data.update_autoscroll()
+
         # Update monitor visual cues
         midiexplorer.gui.windows.mon.blink.update_mon_status()
 
@@ -28,8 +28,9 @@ def enable(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
     logger = Logger()
 
     # Debug
-    stack_frame = inspect.stack()[1]
-    logger.log_debug(f"Callback {stack_frame.function} ({stack_frame.filename} line {stack_frame.lineno}):")
+    # Only the caller's frame is needed: inspect.stack() would build (and read the source context of) the whole stack.
+    caller = inspect.currentframe().f_back
+    logger.log_debug(f"Callback {caller.f_code.co_name} ({caller.f_code.co_filename} line {caller.f_lineno}):")
     logger.log_debug(f"\tSender: {sender!r}")
     logger.log_debug(f"\tApp data: {app_data!r}")
     logger.log_debug(f"\tUser data: {user_data!r}")
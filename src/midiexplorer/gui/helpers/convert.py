@@ -7,6 +7,9 @@
 """
 Data conversions.
 """
+import functools
+from typing import Callable
+
 from dearpygui import dearpygui as dpg
 
 
@@ -23,6 +26,50 @@ def add_string_value_preconv(tag: str) -> None:
     dpg.add_string_value(tag=f'{tag}_dec')
 
 
+UNIT_NAMES = {
+    'X': "Hexadecimal",
+    'd': "Decimal",
+    'b': "Binary",
+    'c': "Character",
+}
+
+
+def _convert_int(unit: chr, value: int, length: int, padding: int) -> str:
+    """Converts a single integer to a text representation in the specified unit.
+
+    :param unit: Unit to convert to (Format specification type)
+    :param value: Value to convert
+    :param length: Conversion length
+    :param padding: Prefixed padding length
+    :return: Text representation of the value in unit format
+    """
+    return f"{' ':{padding}}{value:0{length}{unit}}"
+
+
+def _convert_seq(unit: chr, values: tuple[int] | list[int], length: int, padding: int) -> str:
+    """Converts a group of integers to a text representation in the specified unit.
+
+    :param unit: Unit to convert to (Format specification type)
+    :param values: Values to convert
+    :param length: Conversion length
+    :param padding: Prefixed padding length
+    :return: Text representation of values in unit format
+    """
+    return "".join([f"{' ':{padding}}{value:0{length}{unit}}" for value in values])
+
+
+def _prefix_unit_name(unit: chr, converted_values: str) -> str:
+    """Prefixes converted values with their unit name.
+
+    :param unit: Unit the values were converted to (Format specification type)
+    :param converted_values: Text representation of value(s)
+    :return: Text representation of value(s) prefixed with the unit name
+    """
+    unit_name = UNIT_NAMES.get(unit, "Unknown")
+    unit_name_padding = 12 - len(unit_name)
+    return f"{unit_name}:{' ':{unit_name_padding}}{converted_values.rstrip()}"
+
+
 def convert_to(unit: chr, values: int | tuple[int] | list[int], length, padding) -> str:
     """Converts a single integer or a group to a text representation in the specified unit.
 
@@ -32,25 +79,13 @@ def convert_to(unit: chr, values: int | tuple[int] | list[int], length, padding)
     :param padding: Prefixed padding length
     :return: Text representation of value(s) in unit format
     """
-    unit_name = "Unknown"
-    if unit == 'X':
-        unit_name = "Hexadecimal"
-    if unit == 'd':
-        unit_name = "Decimal"
-    if unit == 'b':
-        unit_name = "Binary"
-    if unit == 'c':
-        unit_name = "Character"
-    unit_name_padding = 12 - len(unit_name)
-
     converted_values = ""
     if values is not None:
         if isinstance(values, int):
-            converted_values += f"{' ':{padding}}{values:0{length}{unit}}"
+            converted_values = _convert_int(unit, values, length, padding)
         else:
-            for value in values:
-                converted_values += f"{' ':{padding}}{value:0{length}{unit}}"
-    return f"{unit_name}:{' ':{unit_name_padding}}{converted_values.rstrip()}"
+            converted_values = _convert_seq(unit, values, length, padding)
+    return _prefix_unit_name(unit, converted_values)
 
 
 def conv2hex(values: int | tuple[int] | list[int], length: int = 2, padding: int = 7) -> str:
@@ -109,6 +144,37 @@ def set_value_preconv(source: str, value: int | tuple[int] | list[int]) -> None:
     dpg.set_value(f'{source}_dec', conv2dec(value))
 
 
+def _conversions_text(convert: Callable[[chr, int | tuple[int] | list[int], int, int], str],
+                      values: int | tuple[int] | list[int], hlen: int, dlen: int, blen: int) -> str:
+    """Converts value(s) to hexadecimal, decimal and binary text representations, one per line.
+
+    :param convert: Conversion function matching the value(s) type
+    :param values: Value(s) to convert
+    :param hlen: Hexadecimal length
+    :param dlen: Decimal length
+    :param blen: Binary length
+    :return: Text representations of value(s) prefixed with their unit name
+    """
+    return "\n".join((
+        _prefix_unit_name('X', convert('X', values, hlen, blen - hlen + 1)),
+        _prefix_unit_name('d', convert('d', values, dlen, blen - dlen + 1)),
+        _prefix_unit_name('b', convert('b', values, blen, 1)),
+    ))
+
+
+@functools.lru_cache(maxsize=None)  # The same few hundred values are converted each time the widgets are created
+def _int_conversions_text(value: int, hlen: int, dlen: int, blen: int) -> str:
+    """Converts a single integer to hexadecimal, decimal and binary text representations, one per line.
+
+    :param value: Value to convert
+    :param hlen: Hexadecimal length
+    :param dlen: Decimal length
+    :param blen: Binary length
+    :return: Text representations of the value prefixed with their unit name
+    """
+    return _conversions_text(_convert_int, value, hlen, dlen, blen)
+
+
 def tooltip_conv(title: str, values: int | tuple[int] | list[int] | None = None,
                  hlen: int = 2, dlen: int = 3, blen: int = 8) -> None:
     """Adds a tooltip with data converted to hexadecimal, decimal and binary.
@@ -122,14 +188,12 @@ def tooltip_conv(title: str, values: int | tuple[int] | list[int] | None = None,
     """
     with dpg.tooltip(dpg.last_item()):
         dpg.add_text(f"{title}")
-        hconv = conv2hex(values, hlen, blen - hlen + 1)
-        dconv = conv2dec(values, dlen, blen - dlen + 1)
-        bconv = conv2bin(values, blen)
         if values is not None:
             dpg.add_text()
-            dpg.add_text(f"{hconv}")
-            dpg.add_text(f"{dconv}")
-            dpg.add_text(f"{bconv}")
+            if isinstance(values, int):
+                dpg.add_text(_int_conversions_text(values, hlen, dlen, blen))
+            else:
+                dpg.add_text(_conversions_text(_convert_seq, values, hlen, dlen, blen))
 
 
 def tooltip_preconv(static_title: str | None = None, title_value_source: str | None = None,
@@ -21,8 +21,7 @@ def add(timestamp: Timestamp, source: str, data: mido.Message) -> None:
     :param data: MIDI data
 
     """
-    logger = Logger()
-
-    logger.log_debug(f"Adding data from {source} to probe at {timestamp}: {data!r}")
+    if DEBUG:
+        Logger().log_debug(f"Adding data from {source} to probe at {timestamp}: {data!r}")
 
     midiexplorer.gui.windows.mon.data.update_gui_monitor(data)
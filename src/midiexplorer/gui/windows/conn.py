@@ -662,7 +662,8 @@ def handle_received_data(timestamp: Timestamp, source: str, dest: str, midi_data
     """
     logger = Logger()
 
-    logger.log_debug(f"Received MIDI data from {source} to {dest} at {timestamp.value}: {midi_data}")
+    if DEBUG:
+        logger.log_debug(f"Received MIDI data from {source} to {dest} at {timestamp.value}: {midi_data}")
 
     port = None
     try:
@@ -671,7 +672,8 @@ def handle_received_data(timestamp: Timestamp, source: str, dest: str, midi_data
         logger.log_warning(f"Port for item #{dest} not found!")
         pass
     if isinstance(port, MidiOutPort):
-        logger.log_debug(f"Echoing MIDI data to midi output {port.label}")
+        if DEBUG:
+            logger.log_debug(f"Echoing MIDI data to midi output {port.label}")
         port.port.send(midi_data)
 
     dest_label = dest
@@ -693,7 +695,8 @@ def handle_received_data(timestamp: Timestamp, source: str, dest: str, midi_data
         probe_thru_user_data: MidiOutPort = dpg.get_item_user_data('probe_thru')
         if probe_thru_user_data:  # Handle soft-thru
             # logger.log(f"Probe thru has user data: {probe_thru_user_data}")
-            logger.log_debug("Echoing MIDI data to probe thru")
+            if DEBUG:
+                logger.log_debug("Echoing MIDI data to probe thru")
             thru_timestamp = Timestamp()
             probe_thru_user_data.port.send(midi_data)
             hist.data.add(midi_data, "PROBE: Thru", probe_thru_user_data.port.name, thru_timestamp)
@@ -16,19 +16,29 @@ from midiexplorer.gui.helpers.callbacks.debugging import enable as enable_dpg_cb
 from midiexplorer.gui.windows.hist.data import clear_hist_data_table
 
 
-def _add_table_columns():
-    dpg.add_table_column(label="Timestamp (s)")
-    dpg.add_table_column(label="Delta (ms)")
-    dpg.add_table_column(label="Source")
-    dpg.add_table_column(label="Destination")
-    dpg.add_table_column(label="Raw Message (HEX)")
-    if DEBUG:
-        dpg.add_table_column(label="Decoded\nMessage")
-    dpg.add_table_column(label="Status")
-    dpg.add_table_column(label="Channel")
-    dpg.add_table_column(label="Data 1")
-    dpg.add_table_column(label="Data 2")
-    dpg.add_table_column(label="Select", width_fixed=True, width=0, no_header_width=True, no_header_label=True)
+# History data table columns (label, debug only, extra settings)
+HIST_DATA_TABLE_COLUMNS = (
+    ("Timestamp (s)", False, {}),
+    ("Delta (ms)", False, {}),
+    ("Source", False, {}),
+    ("Destination", False, {}),
+    ("Raw Message (HEX)", False, {}),
+    ("Decoded\nMessage", True, {}),
+    ("Status", False, {}),
+    ("Channel", False, {}),
+    ("Data 1", False, {}),
+    ("Data 2", False, {}),
+    ("Select", False, {'width_fixed': True, 'width': 0, 'no_header_width': True, 'no_header_label': True}),
+)
+
+
+def _add_table_columns() -> None:
+    """Adds the history data table columns.
+
+    """
+    for label, debug_only, settings in HIST_DATA_TABLE_COLUMNS:
+        if DEBUG or not debug_only:
+            dpg.add_table_column(label=label, **settings)
 
 
 def create() -> None:
@@ -8,6 +8,7 @@
 History data management.
 """
 
+import functools
 from typing import Any, Callable, Optional
 
 import midi_const
@@ -21,7 +22,7 @@ from midiexplorer.gui.helpers.callbacks.debugging import \
 from midiexplorer.gui.helpers.constants.slots import Slots
 from midiexplorer.gui.helpers.convert import tooltip_conv
 from midiexplorer.gui.helpers.logger import Logger
-from midiexplorer.gui.windows.mon import notation_modes
+from midiexplorer.gui.windows.mon import CONTROLLERS_NAMES, notation_modes
 from midiexplorer.midi.timestamp import Timestamp
 
 S2MS = 1000  # Seconds to milliseconds ratio
@@ -34,6 +35,7 @@ MAX_SIZE = 250  # Data table struggles with too many elements.
 ###
 hist_data_counter = 0
 selected = None
+autoscroll_pending = False
 
 
 def clear_hist_data_table(
@@ -59,6 +61,40 @@ def clear_hist_data_table(
     dpg.delete_item('hist_data_table', children_only=True, slot=Slots.MOST)
 
 
+def _add_text_with_tooltip(label: str, tooltip: str) -> None:
+    """Adds a history cell text with a plain text tooltip.
+
+    Parents are passed explicitly to avoid the container stack push/pop of the context managers on each row.
+
+    :param label: Cell text
+    :param tooltip: Tooltip text
+
+    """
+    dpg.add_text(tooltip, parent=dpg.add_tooltip(dpg.add_text(label)))
+
+
+def _xstr(s: Any) -> str:
+    """Equivalent to str() but avoids displaying 'None'.
+
+    :param s: Object to convert.
+    :return: String representation or an empty string for None.
+
+    """
+    return '' if s is None else str(s)
+
+
+@functools.lru_cache(maxsize=None)  # Only a few message types
+def _get_status(msg_type: str) -> tuple[int, str]:
+    """Gets the status of a message type.
+
+    :param msg_type: mido message type.
+    :return: MIDI status number and name.
+
+    """
+    status_byte = midiexplorer.midi.mido2standard.get_status_by_type(msg_type)
+    return status_byte, midi_const.STATUS_BYTES[status_byte]
+
+
 def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp) -> None:
     """Adds data to the history table.
 
@@ -68,9 +104,7 @@ def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp)
     :param timestamp: Message data timestamp
 
     """
-    global hist_data_counter, selected
-
-    logger = Logger()
+    global hist_data_counter, selected, autoscroll_pending
 
     # Unselect
     if selected is not None:
@@ -86,10 +120,11 @@ def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp)
 
     # FIXME: data.time can also be 0 when using rtmidi time delta. How do we discriminate? Use another property in mido?
     if data.time and DEBUG:
-        logger.log_debug("Timing: Using rtmidi time delta")
+        Logger().log_debug("Timing: Using rtmidi time delta")
         delta = data.time
     else:
-        logger.log_debug("Timing: Rtmidi time delta not available. Computing timestamp locally.")
+        if DEBUG:
+            Logger().log_debug("Timing: Rtmidi time delta not available. Computing timestamp locally.")
         # FIXME: this delta is not relative to the same message train but to every handled messages!
         delta = timestamp.delta
 
@@ -105,24 +140,16 @@ def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp)
     ):
 
         # Timestamp (s)
-        dpg.add_text(f"{timestamp.value:12.4f}")
-        with dpg.tooltip(dpg.last_item()):
-            dpg.add_text(f"{timestamp.value}")
+        _add_text_with_tooltip(f"{timestamp.value:12.4f}", f"{timestamp.value}")
 
         # Delta (ms)
-        dpg.add_text(f"{delta * S2MS:12.4f}")
-        with dpg.tooltip(dpg.last_item()):
-            dpg.add_text(f"{delta * S2MS}")
+        _add_text_with_tooltip(f"{delta * S2MS:12.4f}", f"{delta * S2MS}")
 
         # Source
-        dpg.add_text(source)
-        with dpg.tooltip(dpg.last_item()):
-            dpg.add_text(source)
+        _add_text_with_tooltip(source, source)
 
         # Destination
-        dpg.add_text(destination)
-        with dpg.tooltip(dpg.last_item()):
-            dpg.add_text(destination)
+        _add_text_with_tooltip(destination, destination)
 
         # Raw message
         raw_label = data.hex()
@@ -132,18 +159,13 @@ def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp)
         # Decoded message
         if DEBUG:
             dec_label = str(data)
-            dpg.add_text(dec_label)
-            with dpg.tooltip(dpg.last_item()):
-                dpg.add_text(dec_label)
+            _add_text_with_tooltip(dec_label, dec_label)
 
         # Status
-        status_byte = midiexplorer.midi.mido2standard.get_status_by_type(
-            data.type
-        )
-        stat_label = midi_const.STATUS_BYTES[status_byte]
+        status_byte, stat_label = _get_status(data.type)
         dpg.add_text(stat_label)
         if hasattr(data, 'channel'):
-            status_nibble = int((status_byte - data.channel) / 16)
+            status_nibble = status_byte >> 4
             tooltip_conv(stat_label, status_nibble, hlen=1, dlen=2, blen=4)
         else:
             tooltip_conv(stat_label, status_byte)
@@ -155,25 +177,19 @@ def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp)
         dpg.add_text(f'{chan_label: >2}')
         tooltip_conv(chan_label, chan_val, hlen=1, dlen=2, blen=4)
 
-        # Helper function equivalent to str() but avoids displaying 'None'.
-        xstr: Callable[[Any], str] = lambda s: '' if s is None else str(s)
-
         # Data 1
-        if data0_dec:
-            dpg.add_text(str(data0_dec))
-        else:
-            dpg.add_text(f'{xstr(data1_val): >3}')
+        dpg.add_text(str(data0_dec) if data0_dec else f'{_xstr(data1_val): >3}')
         prefix0 = ""
         if data0_name:
             prefix0 = data0_name + ": "
-        tooltip_conv(prefix0 + xstr(data0_dec if data0_dec else data0_val), data0_val, blen=7)
+        tooltip_conv(prefix0 + _xstr(data0_dec if data0_dec else data0_val), data0_val, blen=7)
 
         # Data 2
-        dpg.add_text(f'{xstr(data1_val): >3}')
+        dpg.add_text(f'{_xstr(data1_val): >3}')
         prefix1 = ""
         if data1_name:
             prefix1 = data1_name + ": "
-        tooltip_conv(prefix1 + xstr(data1_dec if data1_dec else data1_val), data1_val, blen=7)
+        tooltip_conv(prefix1 + _xstr(data1_dec if data1_dec else data1_val), data1_val, blen=7)
 
         # Selectable
         target = f'selectable_{hist_data_counter}'
@@ -184,9 +200,24 @@ def add(data: mido.Message, source: str, destination: str, timestamp: Timestamp)
     # TODO: per message type color coding
     # dpg.highlight_table_row(table_id, i, [255, 0, 0, 100])
 
-    # Autoscroll
+    # Autoscroll once per frame from update_autoscroll()
+    autoscroll_pending = True
+
+
+def update_autoscroll() -> None:
+    """Scrolls the history table to the latest data.
+
+    Called once per frame from the main loop to spare scrolling for each row added in between.
+
+    """
+    global autoscroll_pending
+
+    if not autoscroll_pending:
+        return
+    autoscroll_pending = False
+
     if dpg.get_value('hist_data_table_mode') == "Auto-Scroll":
-         dpg.set_y_scroll('hist_data_table', -1.0)
+        dpg.set_y_scroll('hist_data_table', -1.0)
 
 
 def _selection(sender, app_data, user_data):
@@ -221,6 +252,41 @@ def _selection(sender, app_data, user_data):
         dpg.enable_item('generator_send_button')
 
 
+# Note names by notation mode, indexed by note number
+NOTES_NAMES = {mode: tuple(names.get(note) for note in range(128)) for mode, names in notation_modes.items()}
+
+
+def _note_name(note: int) -> str:
+    """Names a note in the current notation mode.
+
+    :param note: MIDI note number.
+    :return: Note name.
+
+    """
+    return NOTES_NAMES[dpg.get_value('notation_mode')][note]
+
+
+# Data 1 & 2 names, values and decoded values by message type.
+# Dispatched once per message instead of testing each type in turn.
+DATA_DECODERS: dict[str, Callable[[mido.Message], tuple]] = {
+    'note_off': lambda data: ("Note", data.note, _note_name(data.note), "Velocity", data.velocity, False),
+    'note_on': lambda data: ("Note", data.note, _note_name(data.note), "Velocity", data.velocity, False),
+    'polytouch': lambda data: ("Note", data.note, _note_name(data.note), False, data.value, False),
+    'control_change': lambda data: (
+        "Controller", data.control, CONTROLLERS_NAMES[data.control], "Value", data.value, False
+    ),
+    # TODO: Optionally decode General MIDI names.
+    'program_change': lambda data: ("Program", data.program, False, False, None, False),
+    'aftertouch': lambda data: ("Value", data.value, False, False, None, False),
+    'pitchwheel': lambda data: ("Pitch", data.pitch, False, False, None, False),
+    'sysex': lambda data: ("Data", data.data, False, False, None, False),
+    # TODO: decode frame type and value
+    'quarter_frame': lambda data: ("Frame type", data.frame_type, False, "Frame value", data.frame_value, False),
+    'songpos': lambda data: ("Position Pointer", data.pos, False, False, None, False),
+    'song_select': lambda data: ("Song #", data.song, False, False, None, False),
+}
+
+
 def decode(data: mido.Message) -> tuple[int, int, int, int, int, int, int]:
     """Decodes the data.
 
@@ -234,52 +300,7 @@ def decode(data: mido.Message) -> tuple[int, int, int, int, int, int, int]:
         chan_val = data.channel
 
     # Data 1 & 2
-    data0_name: str | False = False
-    data0_val: int | tuple | None = None
-    data0_dec: str | False = False
-    data1_name: str | False = False
-    data1_val: int | None = None
-    data1_dec: str | False = False
-    if 'note' in data.type:
-        data0_name = "Note"
-        data0_val: int = data.note
-        data0_dec = notation_modes.get(dpg.get_value('notation_mode')).get(data.note)
-        data1_name = "Velocity"
-        data1_val: int = data.velocity
-    elif 'polytouch' == data.type:
-        data0_name = "Note"
-        data0_val: int = data.note
-        data0_dec = notation_modes.get(dpg.get_value('notation_mode')).get(data.note)
-        data1_val: int = data.value
-    elif 'control_change' == data.type:
-        data0_name = "Controller"
-        data0_val: int = data.control
-        data0_dec = midi_const.CONTROLLER_NUMBERS.get(data.control)
-        data1_name = "Value"
-        data1_val: int = data.value
-    elif 'program_change' == data.type:
-        data0_name = "Program"
-        data0_val: int = data.program
-        # TODO: Optionally decode General MIDI names.
-    elif 'aftertouch' == data.type:
-        data0_name = "Value"
-        data0_val: int = data.value
-    elif 'pitchwheel' == data.type:
-        data0_name = "Pitch"
-        data0_val: int = data.pitch
-    elif 'sysex' == data.type:
-        data0_name = "Data"
-        data0_val: tuple = data.data
-    elif 'quarter_frame' == data.type:
-        data0_name = "Frame type"
-        data0_val = data.frame_type  # TODO: decode
-        data1_name = "Frame value"
-        data1_val = data.frame_value  # TODO: decode
-    elif 'songpos' == data.type:
-        data0_name = "Position Pointer"
-        data0_val = data.pos
-    elif 'song_select' == data.type:
-        data0_name = "Song #"
-        data0_val = data.song
-
-    return chan_val, data0_name, data0_val, data0_dec, data1_name, data1_val, data1_dec
+    decoder = DATA_DECODERS.get(data.type)
+    if decoder is None:  # No data
+        return chan_val, False, None, False, False, None, False
+    return (chan_val, *decoder(data))
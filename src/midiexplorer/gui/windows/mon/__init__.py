@@ -7,7 +7,6 @@
 """
 Monitor window.
 """
-
 from typing import Any, Optional
 
 import midi_const
@@ -22,8 +21,117 @@ from midiexplorer.gui.helpers.callbacks.debugging import (
 from midiexplorer.gui.helpers.convert import (
     add_string_value_preconv, tooltip_conv, tooltip_preconv
 )
-from midiexplorer.gui.windows.mon.blink import get_supported_indicators
-from midiexplorer.gui.windows.mon.settings import eox_categories, notation_modes
+from midiexplorer.gui.windows.mon.blink import (
+    ACT_THEME, CHANNELS_TAGS, CONTROLLERS_TAGS, CONTROLLERS_VALUES_TAGS, FORCE_ACT_THEME, NOTES_TAGS,
+    blink_duration, set_controllers_created, update_blink_duration
+)
+from midiexplorer.gui.windows.mon.data import (
+    update_zero_velocity_note_on_is_note_off, zero_velocity_note_on_is_note_off
+)
+from midiexplorer.gui.windows.mon.settings import (
+    default_notation_mode, eox_categories, notation_modes, notation_modes_names
+)
+
+###
+# GLOBAL VARIABLES
+###
+# Notation mode the keyboard is currently labeled with
+keyboard_notation_mode = default_notation_mode
+
+# Channel voice messages (page 9) buttons (tag, label, status)
+CHANNEL_VOICE_BUTTONS = (
+    ('mon_note_off', "N OF", 0x8),
+    ('mon_note_on', "N ON", 0x9),
+    ('mon_polytouch', "PKPR", 0xA),
+    ('mon_control_change', " CC ", 0xB),
+    ('mon_program_change', " PC ", 0xC),
+    ('mon_aftertouch', "CHPR", 0xD),
+    ('mon_pitchwheel', "PBCH", 0xE),
+)
+# Channel mode messages (page 20) buttons (tag, label, controller)
+CHANNEL_MODE_BUTTONS = (
+    ('mon_all_sound_off', "ASOF", 120),
+    ('mon_reset_all_controllers', "RAC ", 121),
+    ('mon_local_control', " LC ", 122),
+    ('mon_all_notes_off', "ANOF", 123),
+    ('mon_omni_off', "O OF", 124),
+    ('mon_omni_on', "O ON", 125),
+    ('mon_mono_on', "M ON", 126),
+    ('mon_poly_on', "P ON", 127),
+)
+# Status indicators buttons (tag, label, status)
+SYSTEM_COMMON_BUTTONS = (
+    ('mon_quarter_frame', " QF ", 0xF1),
+    ('mon_songpos', "SGPS", 0xF2),
+    ('mon_song_select', "SGSL", 0xF3),
+    ('mon_undef1', "UND ", 0xF4),  # FIXME: unsupported by mido
+    ('mon_undef2', "UND ", 0xF5),  # FIXME: unsupported by mido
+    ('mon_tune_request', " TR ", 0xF6),
+)
+SYSTEM_REAL_TIME_BUTTONS = (
+    ('mon_clock', "CLK ", 0xF8),
+    ('mon_undef3', "UND ", 0xF9),  # FIXME: unsupported by mido
+    ('mon_start', "STRT", 0xFA),
+    ('mon_continue', "CTNU", 0xFB),
+    ('mon_stop', "STOP", 0xFC),
+    ('mon_undef4', "UND ", 0xFD),  # FIXME: unsupported by mido
+    ('mon_active_sensing', " AS ", 0xFE),
+    ('mon_reset', "RST ", 0xFF),
+)
+SYSTEM_EXCLUSIVE_BUTTONS = (
+    ('mon_sysex', "SOX ", 0xF0),
+)
+# System messages status rows (title, category, buttons, messages, EOX alternate representation)
+SYSTEM_MESSAGES_ROWS = (
+    # System common messages (page 27)
+    ("System Messages", "Common", SYSTEM_COMMON_BUTTONS, midi_const.SYSTEM_COMMON_MESSAGES, 'common'),
+    # System real time messages (page 30)
+    ("", "Real-Time", SYSTEM_REAL_TIME_BUTTONS, midi_const.SYSTEM_REAL_TIME_MESSAGES, None),
+    # System exclusive messages
+    ("", "Exclusive", SYSTEM_EXCLUSIVE_BUTTONS, midi_const.SYSTEM_EXCLUSIVE_MESSAGES, 'syx'),
+)
+
+# EOX groups to hide and show by category
+EOX_GROUPS_VISIBILITY = {
+    eox_categories[0]: ('mon_end_of_exclusive_syx_grp', 'mon_end_of_exclusive_common_grp'),
+    eox_categories[1]: ('mon_end_of_exclusive_common_grp', 'mon_end_of_exclusive_syx_grp'),
+}
+
+KEY_WIDTH = 12  # Keyboard key width
+KEY_HEIGHT = 90  # Keyboard key height
+KEY_MARGIN = 1  # Margin between keyboard keys
+
+
+# Pitch classes bitmasks (bit n set for pitch class n)
+SHARP_PITCH_CLASSES_MASK = 0b010101001010  # C#, D#, F#, G# and A#
+WIDE_GAP_PITCH_CLASSES_MASK = 0b010000001000  # D# and A#: no black key follows the next white key
+
+
+def _compute_keys_positions() -> tuple[tuple[float, int], ...]:
+    """Computes the keyboard keys positions.
+
+    The layout is static, so this only needs to run once.
+
+    :return: (x, y) position of each MIDI note key.
+    """
+    positions = []
+    bxpos = KEY_WIDTH / 2  # Black key X position
+    wxpos = 0  # White key X position
+    for note in range(128):
+        pitch_class = note % 12
+        if not (SHARP_PITCH_CLASSES_MASK >> pitch_class) & 1:
+            positions.append((wxpos, KEY_HEIGHT))
+            wxpos += KEY_WIDTH + KEY_MARGIN
+        else:
+            positions.append((bxpos, 0))
+            if (WIDE_GAP_PITCH_CLASSES_MASK >> pitch_class) & 1:
+                bxpos += (KEY_WIDTH + KEY_MARGIN) * 2
+            else:
+                bxpos += KEY_WIDTH + KEY_MARGIN
+    return tuple(positions)
+
+
+KEYS_POSITIONS = _compute_keys_positions()
 
 
 def _verticalize(text: str) -> str:
@@ -32,8 +140,54 @@ def _verticalize(text: str) -> str:
     :param text: text to convert
     :return: verticalized text
     """
-    v_text = "\n".join(text)
-    return v_text
+    return "\n".join(text)
+
+
+# Note names never change at runtime: build the keyboard labels and tooltips once.
+VERTICAL_NOTES_LABELS = {
+    mode: tuple(_verticalize(name) for name in names.values())
+    for mode, names in notation_modes.items()
+}
+
+
+def _build_notes_tooltips() -> tuple[str, ...]:
+    """Builds the keyboard keys tooltips.
+
+    :return: Names of each MIDI note in all notations.
+    """
+    alpha_en = midiexplorer.midi.notes.MIDI_NOTES_ALPHA_EN
+    syllabic = midiexplorer.midi.notes.MIDI_NOTES_SYLLABIC
+    alpha_de = midiexplorer.midi.notes.MIDI_NOTES_ALPHA_DE
+    return tuple(
+        f"English Alphabetical:\t{alpha_en[index]}\n"
+        f"Syllabic:{' ':12}\t{syllabic[index]}\n"
+        f"German Alphabetical: \t{alpha_de[index]}"
+        for index in range(128)
+    )
+
+
+NOTES_TOOLTIPS = _build_notes_tooltips()
+
+# Channels widgets labels and titles
+CHANNELS_LABELS = tuple(f"{channel + 1:2d}" for channel in range(16))
+CHANNELS_TITLES = tuple(f"Channel {channel + 1}" for channel in range(16))
+
+# Controllers widgets labels, titles and rows tags
+CONTROLLERS_BY_ROW_BITS = 3  # Group controllers by 8 per row
+CONTROLLERS_LABELS = tuple(f"{controller:3d}" for controller in range(128))
+CONTROLLERS_NAMES = tuple(midi_const.CONTROLLER_NUMBERS[controller] for controller in range(128))
+CONTROLLERS_VALUES_TITLES = tuple(f"{name} Value:" for name in CONTROLLERS_NAMES)
+CONTROLLERS_ROWS_TAGS = tuple(f'ctrls_{rownum}' for rownum in range(128 >> CONTROLLERS_BY_ROW_BITS))
+
+
+def _add_table_columns(count: int) -> None:
+    """Adds untitled columns to the current table.
+
+    :param count: Number of columns to add
+    """
+    add_table_column = dpg.add_table_column
+    for _i in range(count):
+        add_table_column()
 
 
 def _update_eox_category(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
@@ -50,12 +204,11 @@ def _update_eox_category(sender: int | str, app_data: Any, user_data: Optional[A
     if DEBUG:
         enable_dpg_cb_debugging(sender, app_data, user_data)
 
-    if dpg.get_value('eox_category') == user_data[0]:
-        dpg.hide_item('mon_end_of_exclusive_syx_grp')
-        dpg.show_item('mon_end_of_exclusive_common_grp')
-    else:
-        dpg.hide_item('mon_end_of_exclusive_common_grp')
-        dpg.show_item('mon_end_of_exclusive_syx_grp')
+    hide_tag, show_tag = EOX_GROUPS_VISIBILITY[app_data]  # app_data is the selected category
+    # Direct visibility configuration spares the hide_item() and show_item() wrappers
+    with dpg.mutex():  # Swap both groups within the same frame
+        dpg.configure_item(hide_tag, show=False)
+        dpg.configure_item(show_tag, show=True)
 
 
 def _update_notation_mode(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
@@ -69,686 +222,532 @@ def _update_notation_mode(sender: int | str, app_data: Any, user_data: Optional[
     :param user_data: argument is Optionally used to pass your own python data into the function.
 
     """
-    if DEBUG:
-        enable_dpg_cb_debugging(sender, app_data, user_data)
-
-    # Update keyboard
-    for note_number in range(0, 128):  # All MIDI notes
-        dpg.configure_item(
-            f'note_{note_number}',
-            format=_verticalize(
-                user_data.get(dpg.get_value('notation_mode')).get(note_number)
-            )
-        )
+    global keyboard_notation_mode
 
-
-def create() -> None:
-    """Creates the monitor window.
-
-    """
-    # -------------------------
-    # DEAR PYGUI VALUE REGISTRY
-    # -------------------------
-    with dpg.value_registry():
-        # ------------
-        # Preferences
-        # ------------
-        dpg.add_float_value(tag='mon_blink_duration', default_value=.25)  # seconds
-        # Per standard, consider note-on with velocity set to 0 as note-off
-        dpg.add_bool_value(tag='zero_velocity_note_on_is_note_off', default_value=True)
-        dpg.add_string_value(tag='eox_category', default_value=eox_categories[0])
-        dpg.add_string_value(tag='notation_mode', default_value=next(iter(notation_modes.keys())))  # First key
-        # ----------------------------
-        # Indicators blink management
-        # ----------------------------
-        for indicator in get_supported_indicators():
-            dpg.add_float_value(tag=f'{indicator}_active_until', default_value=0)  # seconds
-        # ----------------
-        # Program decoding
-        # ----------------
-        dpg.add_string_value(tag='pc_num')
-        dpg.add_string_value(tag='pc_group_name')
-        dpg.add_string_value(tag='pc_name')
-        # ---------------
-        # SysEx decoding
-        # ---------------
-        dpg.add_string_value(tag='syx_id_group')
-        dpg.add_string_value(tag='syx_id_region')
-        dpg.add_string_value(tag='syx_id_name')
-        add_string_value_preconv(tag='syx_id_val')
-        add_string_value_preconv(tag='syx_device_id')
-        add_string_value_preconv(tag='syx_payload')
-        # Defined Universal SysEx
-        dpg.add_string_value(tag='syx_sub_id1_name')
-        add_string_value_preconv(tag='syx_sub_id1_val')
-        dpg.add_string_value(tag='syx_sub_id2_name')
-        add_string_value_preconv(tag='syx_sub_id2_val')
-
-    # ---------------------------------------
-    # DEAR PYGUI THEME for activated buttons
-    # ---------------------------------------
-    red = (255, 0, 0)
-    dark_red = (128, 0, 0)
-    magenta = (170, 0, 170)
-    dark_magenta = (85, 0, 85)
-    with dpg.theme(tag='__act'):
-        with dpg.theme_component(dpg.mvButton):
-            dpg.add_theme_color(
-                tag='__act_but_col',
-                target=dpg.mvThemeCol_Button,
-                value=red,
-            )
-        with dpg.theme_component(dpg.mvSliderInt):
-            dpg.add_theme_color(
-                tag='__act_sli_col',
-                target=dpg.mvThemeCol_SliderGrab,
-                value=red,
-            )
-            dpg.add_theme_color(
-                tag='__act_sli_bg_col',
-                target=dpg.mvThemeCol_FrameBg,
-                value=dark_red,
-            )
-    with dpg.theme(tag='__force_act'):
-        with dpg.theme_component(dpg.mvButton):
-            dpg.add_theme_color(
-                tag='__force_act_but_col',
-                target=dpg.mvThemeCol_Button,
-                value=magenta,
-            )
-        with dpg.theme_component(dpg.mvSliderInt):
-            dpg.add_theme_color(
-                tag='__force_act_sli_col',
-                target=dpg.mvThemeCol_SliderGrab,
-                value=magenta,
-            )
-            dpg.add_theme_color(
-                tag='__force_act_sli_bg_col',
-                target=dpg.mvThemeCol_FrameBg,
-                value=dark_magenta,
-            )
-
-    # -------------------
-    # Monitor window size
-    # -------------------
-    # TODO: compute dynamically?
-    mon_win_height = 910
     if DEBUG:
-        mon_win_height = 685
-
-    # --------------
-    # Monitor window
-    # --------------
-    with dpg.window(
-            tag='mon_win',
-            label="Monitor",
-            width=1005,
-            height=mon_win_height,
-            no_close=True,
-            collapsed=False,
-            pos=[900, 20]
-    ):
-
-        with dpg.menu_bar():
-            # --------
-            # Settings
-            # --------
-            with dpg.menu(label="Display"):
-                with dpg.group(horizontal=True):
-                    dpg.add_text("Persistence:")
-                    dpg.add_slider_float(
-                        tag='mon_blink_duration_slider',
-                        label="seconds",
-                        min_value=1 / 120, max_value=2 / 3, source='mon_blink_duration',  # Min is one frame@120FPS
-                        callback=lambda:
-                        dpg.set_value('mon_blink_duration', dpg.get_value('mon_blink_duration_slider'))
-                    )
-                with dpg.group(horizontal=True):
-                    dpg.add_text("Notation:")
-                    dpg.add_radio_button(
-                        items=list(notation_modes.keys()),
-                        default_value=next(iter(notation_modes.values())),  # First value
-                        source='notation_mode',
-                        callback=_update_notation_mode,
-                        user_data=notation_modes
-                    )
-            with dpg.menu(label="Colors"):
-                dpg.add_separator(label="Buttons")
-                dpg.add_color_edit(source='__act_but_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Live")
-                dpg.add_color_edit(source='__force_act_but_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Selected")
-                dpg.add_separator(label="Sliders")
-                dpg.add_color_edit(source='__act_sli_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Live")
-                dpg.add_color_edit(source='__force_act_sli_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Selected")
-                dpg.add_text("Background")
-                dpg.add_color_edit(source='__act_sli_bg_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Live")
-                dpg.add_color_edit(source='__force_act_sli_bg_col',  no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Selected")
-
-            with dpg.menu(label="Advanced"):
-                with dpg.group(horizontal=True):
-                    dpg.add_text("Zero (0) velocity Note On is Note Off:")
-                    dpg.add_checkbox(label="(default, MIDI specification compliant)",
-                                     source='zero_velocity_note_on_is_note_off')
-                with dpg.group(horizontal=True):
-                    dpg.add_text("EOX is a:")
-                    dpg.add_radio_button(
-                        items=eox_categories,
-                        default_value=eox_categories[0],
-                        source='eox_category',
-                        callback=_update_eox_category,
-                        user_data=eox_categories
-                    )
-        # TODO: Panic button to reset all monitored states.
-
-        # -----
-        # Mode
-        # -----
-        if DEBUG:
-            # TODO: implement
-            with dpg.collapsing_header(label="MIDI Mode", default_open=False):
-                dpg.add_child_window(tag='mon_midi_mode', height=10, border=False)
-
-                dpg.add_text("Not implemented yet")
-
-                # FIXME: move to settings?
-                dpg.add_input_int(
-                    tag='mode_basic_chan', label="Basic Channel",
-                    default_value=midi_const.POWER_UP_DEFAULT[
-                                      'basic_channel'] + 1
-                    )
-
-                dpg.add_radio_button(
-                    tag='modes',
-                    items=[
-                        "1",  # Omni On - Poly
-                        "2",  # Omni On - Mono
-                        "3",  # Omni Off - Poly
-                        "4",  # Omni Off - Mono
-                    ],
-                    default_value=midi_const.POWER_UP_DEFAULT['mode'],
-                    horizontal=True, enabled=False,
-                )
-
-        # -------
-        # Status
-        # -------
-        status_height = 154
-        if DEBUG:
-            status_height = 180
-        with dpg.collapsing_header(label="Status", default_open=True):
-            dpg.add_child_window(tag='mon_status_container', height=status_height, border=False)
-
-        with dpg.table(parent='mon_status_container', header_row=False, policy=dpg.mvTable_SizingFixedFit):
-            dpg.add_table_column(label="Title")
+        enable_dpg_cb_debugging(sender, app_data, user_data)
 
-            for _i in range(3):
-                dpg.add_table_column()
+    if app_data == keyboard_notation_mode:  # app_data is the selected notation mode
+        return
+    keyboard_notation_mode = app_data
 
-            with dpg.table_row():
-                dpg.add_text("Type")
+    # Update keyboard at once
+    configure_item = dpg.configure_item
+    with dpg.mutex():
+        for tag, label in zip(NOTES_TAGS, VERTICAL_NOTES_LABELS[app_data]):
+            configure_item(tag, format=label)
 
-                dpg.add_button(tag='mon_c', label="CHANNEL")
-                with dpg.tooltip(dpg.last_item()):
-                    dpg.add_text("Channel Message")
 
-                dpg.add_button(tag='mon_s', label="SYSTEM")
-                with dpg.tooltip(dpg.last_item()):
-                    dpg.add_text("System Message")
+def _add_controllers(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
+    """Populates the controllers monitor table.
 
-        hlen = 1  # Hexadecimal
-        dlen = 3  # Decimal
-        blen = 4  # Binary
+    The 128 controllers are the bulk of the monitor widgets and are not required for the first paint.
+    Scheduled as a frame callback from create() when the controllers section starts open
+    or else called when it is first expanded.
 
-        with dpg.table(parent='mon_status_container', header_row=False, policy=dpg.mvTable_SizingFixedFit):
-            dpg.add_table_column(label="Title")
-            for channel in range(17):
-                dpg.add_table_column()
+    :param sender: argument is used by DPG to inform the callback
+                   which item triggered the callback by sending the tag
+                   or 0 if trigger by the application.
+    :param app_data: argument is used DPG to send information to the callback
+                     i.e. the current value of most basic widgets.
+    :param user_data: argument is Optionally used to pass your own python data into the function.
 
-            with dpg.table_row():
-                dpg.add_text("Channel")
+    """
+    if DEBUG:
+        enable_dpg_cb_debugging(sender, app_data, user_data)
 
-                for channel in range(16):
-                    dpg.add_button(tag=f"mon_{channel}", label=f"{channel + 1:2d}")
-                    tooltip_conv(f"Channel {channel + 1}", channel, hlen, dlen, blen)
+    if dpg.does_item_exist('mon_controllers'):  # Already built
+        return
 
-        with dpg.table(parent='mon_status_container', header_row=False, policy=dpg.mvTable_SizingFixedFit):
+    # Hold the DPG mutex once for the whole table instead of on each of the ~400 calls
+    with dpg.mutex():
+        with dpg.table(tag='mon_controllers', parent='mon_controllers_container', header_row=False,
+                       policy=dpg.mvTable_SizingFixedFit):
             dpg.add_table_column(label="Title")
 
-            for _i in range(9):
-                dpg.add_table_column()
-
-            with dpg.table_row():
-                dpg.add_text("Channel Messages")
+            _add_table_columns(17)
 
-                dpg.add_text("Voice")
-
-                # Channel voice messages (page 9)
-                val = 8
-                dpg.add_button(tag='mon_note_off', label="N OF")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
+            controllers_by_row = 1 << CONTROLLERS_BY_ROW_BITS
+            # Widgets creation functions bound once for the loop
+            add_table_row = dpg.add_table_row
+            add_button = dpg.add_button
+            add_input_text = dpg.add_input_text
+            add_text = dpg.add_text
+            #    dpg.add_text("Controllers")
+            #    dpg.add_text("")
+            # TODO: add preference to separate reserved CC120-127
+            for rownum, row_tag in enumerate(CONTROLLERS_ROWS_TAGS):
+                add_table_row(tag=row_tag, parent='mon_controllers')
+                # dpg.add_text("", parent=row_tag)
+                # dpg.add_text("", parent=row_tag)
+                first_controller = rownum << CONTROLLERS_BY_ROW_BITS
+                for controller in range(first_controller, first_controller + controllers_by_row):
+                    with dpg.group(horizontal=True, parent=row_tag):
+                        add_button(
+                            tag=CONTROLLERS_TAGS[controller], label=CONTROLLERS_LABELS[controller]
+                            )
+                        tooltip_conv(CONTROLLERS_NAMES[controller], controller, blen=7)
+                        value_tag = CONTROLLERS_VALUES_TAGS[controller]
+                        add_input_text(
+                            tag=value_tag, enabled=False, width=50
+                            )
+                        with dpg.tooltip(dpg.last_item()):
+                            add_text(CONTROLLERS_VALUES_TITLES[controller])
+                            add_text(source=value_tag)
+                            # TODO: hex and bin realtime conversions
 
-                val += 1
-                dpg.add_button(tag='mon_note_on', label="N ON")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
+        # Display the controllers received before the table existed
+        set_controllers_created()
 
-                val += 1
-                dpg.add_button(tag='mon_polytouch', label="PKPR")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
 
-                val += 1
-                dpg.add_button(tag='mon_control_change', label=" CC ")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
+def create() -> None:
+    """Creates the monitor window.
 
-                val += 1
-                dpg.add_button(tag='mon_program_change', label=" PC ")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
+    """
+    # Hold the DPG mutex once for the whole widgets tree construction instead of on each of the ~700 calls
+    with dpg.mutex():
+        # Lookup tables used throughout the widgets creation
+        channel_voice_messages = midi_const.CHANNEL_VOICE_MESSAGES
+        channel_mode_messages = midi_const.CHANNEL_MODE_MESSAGES
+
+        # -------------------------
+        # DEAR PYGUI VALUE REGISTRY
+        # -------------------------
+        with dpg.value_registry():
+            # ------------
+            # Preferences
+            # ------------
+            dpg.add_float_value(tag='mon_blink_duration', default_value=blink_duration)  # seconds
+            # Per standard, consider note-on with velocity set to 0 as note-off
+            dpg.add_bool_value(tag='zero_velocity_note_on_is_note_off', default_value=zero_velocity_note_on_is_note_off)
+            dpg.add_string_value(tag='eox_category', default_value=eox_categories[0])
+            dpg.add_string_value(tag='notation_mode', default_value=default_notation_mode)
+            # ----------------
+            # Program decoding
+            # ----------------
+            dpg.add_string_value(tag='pc_num')
+            dpg.add_string_value(tag='pc_group_name')
+            dpg.add_string_value(tag='pc_name')
+            # ---------------
+            # SysEx decoding
+            # ---------------
+            dpg.add_string_value(tag='syx_id_group')
+            dpg.add_string_value(tag='syx_id_region')
+            dpg.add_string_value(tag='syx_id_name')
+            add_string_value_preconv(tag='syx_id_val')
+            add_string_value_preconv(tag='syx_device_id')
+            add_string_value_preconv(tag='syx_payload')
+            # Defined Universal SysEx
+            dpg.add_string_value(tag='syx_sub_id1_name')
+            add_string_value_preconv(tag='syx_sub_id1_val')
+            dpg.add_string_value(tag='syx_sub_id2_name')
+            add_string_value_preconv(tag='syx_sub_id2_val')
+
+        # ---------------------------------------
+        # DEAR PYGUI THEME for activated buttons
+        # ---------------------------------------
+        red = (255, 0, 0)
+        dark_red = (128, 0, 0)
+        magenta = (170, 0, 170)
+        dark_magenta = (85, 0, 85)
+        with dpg.theme(tag=ACT_THEME):
+            with dpg.theme_component(dpg.mvButton):
+                dpg.add_theme_color(
+                    tag='__act_but_col',
+                    target=dpg.mvThemeCol_Button,
+                    value=red,
+                )
+            with dpg.theme_component(dpg.mvSliderInt):
+                dpg.add_theme_color(
+                    tag='__act_sli_col',
+                    target=dpg.mvThemeCol_SliderGrab,
+                    value=red,
+                )
+                dpg.add_theme_color(
+                    tag='__act_sli_bg_col',
+                    target=dpg.mvThemeCol_FrameBg,
+                    value=dark_red,
+                )
+        with dpg.theme(tag=FORCE_ACT_THEME):
+            with dpg.theme_component(dpg.mvButton):
+                dpg.add_theme_color(
+                    tag='__force_act_but_col',
+                    target=dpg.mvThemeCol_Button,
+                    value=magenta,
+                )
+            with dpg.theme_component(dpg.mvSliderInt):
+                dpg.add_theme_color(
+                    tag='__force_act_sli_col',
+                    target=dpg.mvThemeCol_SliderGrab,
+                    value=magenta,
+                )
+                dpg.add_theme_color(
+                    tag='__force_act_sli_bg_col',
+                    target=dpg.mvThemeCol_FrameBg,
+                    value=dark_magenta,
+                )
 
-                val += 1
-                dpg.add_button(tag='mon_aftertouch', label="CHPR")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
+        # -------------------
+        # Monitor window size
+        # -------------------
+        # TODO: compute dynamically?
+        mon_win_height = 910
+        if DEBUG:
+            mon_win_height = 685
 
-                val += 1
-                dpg.add_button(tag='mon_pitchwheel', label="PBCH")
-                tooltip_conv(
-                    midi_const.CHANNEL_VOICE_MESSAGES[val], val, hlen, dlen,
-                    blen
-                    )
+        # --------------
+        # Monitor window
+        # --------------
+        with dpg.window(
+                tag='mon_win',
+                label="Monitor",
+                width=1005,
+                height=mon_win_height,
+                no_close=True,
+                collapsed=False,
+                pos=[900, 20]
+        ):
+
+            with dpg.menu_bar():
+                # --------
+                # Settings
+                # --------
+                with dpg.menu(label="Display"):
+                    with dpg.group(horizontal=True):
+                        dpg.add_text("Persistence:")
+                        dpg.add_slider_float(
+                            label="seconds",
+                            min_value=1 / 120, max_value=2 / 3, source='mon_blink_duration',  # Min is one frame@120FPS
+                            callback=update_blink_duration,
+                        )
+                    with dpg.group(horizontal=True):
+                        dpg.add_text("Notation:")
+                        dpg.add_radio_button(
+                            items=notation_modes_names,
+                            default_value=default_notation_mode,
+                            source='notation_mode',
+                            callback=_update_notation_mode,
+                        )
+                with dpg.menu(label="Colors"):
+                    dpg.add_separator(label="Buttons")
+                    dpg.add_color_edit(source='__act_but_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Live")
+                    dpg.add_color_edit(source='__force_act_but_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Selected")
+                    dpg.add_separator(label="Sliders")
+                    dpg.add_color_edit(source='__act_sli_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Live")
+                    dpg.add_color_edit(source='__force_act_sli_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Selected")
+                    dpg.add_text("Background")
+                    dpg.add_color_edit(source='__act_sli_bg_col', no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Live")
+                    dpg.add_color_edit(source='__force_act_sli_bg_col',  no_alpha=True, display_mode=dpg.mvColorEdit_hex, label="Selected")
+
+                with dpg.menu(label="Advanced"):
+                    with dpg.group(horizontal=True):
+                        dpg.add_text("Zero (0) velocity Note On is Note Off:")
+                        dpg.add_checkbox(label="(default, MIDI specification compliant)",
+                                         source='zero_velocity_note_on_is_note_off',
+                                         callback=update_zero_velocity_note_on_is_note_off)
+                    with dpg.group(horizontal=True):
+                        dpg.add_text("EOX is a:")
+                        dpg.add_radio_button(
+                            items=eox_categories,
+                            default_value=eox_categories[0],
+                            source='eox_category',
+                            callback=_update_eox_category,
+                        )
+            # TODO: Panic button to reset all monitored states.
 
+            # -----
+            # Mode
+            # -----
             if DEBUG:
-                # TODO: Channel mode messages (page 20) (CC 120-127)
-                # TODO: add preference to separate reserved CC120-127
-                with dpg.table_row():
-                    dpg.add_text()
-
-                    dpg.add_text("Mode")
+                # TODO: implement
+                with dpg.collapsing_header(label="MIDI Mode", default_open=False):
+                    dpg.add_child_window(tag='mon_midi_mode', height=10, border=False)
 
-                    val = 120
-                    dpg.add_button(tag='mon_all_sound_off', label="ASOF")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
+                    dpg.add_text("Not implemented yet")
 
-                    val += 1
-                    dpg.add_button(
-                        tag='mon_reset_all_controllers', label="RAC "
+                    # FIXME: move to settings?
+                    dpg.add_input_int(
+                        tag='mode_basic_chan', label="Basic Channel",
+                        default_value=midi_const.POWER_UP_DEFAULT[
+                                          'basic_channel'] + 1
                         )
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-                    val += 1
-                    dpg.add_button(tag='mon_local_control', label=" LC ")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-                    val += 1
-                    dpg.add_button(tag='mon_all_notes_off', label="ANOF")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-                    val += 1
-                    dpg.add_button(tag='mon_omni_off', label="O OF")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-                    val += 1
-                    dpg.add_button(tag='mon_omni_on', label="O ON")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-                    val += 1
-                    dpg.add_button(tag='mon_mono_on', label="M ON")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-                    val += 1
-                    dpg.add_button(tag='mon_poly_on', label="P ON")
-                    tooltip_conv(midi_const.CHANNEL_MODE_MESSAGES[val], val)
-
-            with dpg.table_row():
-                dpg.add_text("System Messages")
-
-                dpg.add_text("Common")
-
-                val = 0xF1
-                # System common messages (page 27)
-                dpg.add_button(tag='mon_quarter_frame', label=" QF ")
-                tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
-
-                val += 1
-                dpg.add_button(tag='mon_songpos', label="SGPS")
-                tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
 
-                val += 1
-                dpg.add_button(tag='mon_song_select', label="SGSL")
-                tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
-
-                # FIXME: unsupported by mido
-                val += 1
-                dpg.add_button(tag='mon_undef1', label="UND ")
-                tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
+                    dpg.add_radio_button(
+                        tag='modes',
+                        items=[
+                            "1",  # Omni On - Poly
+                            "2",  # Omni On - Mono
+                            "3",  # Omni Off - Poly
+                            "4",  # Omni Off - Mono
+                        ],
+                        default_value=midi_const.POWER_UP_DEFAULT['mode'],
+                        horizontal=True, enabled=False,
+                    )
 
-                # FIXME: unsupported by mido
-                val += 1
-                dpg.add_button(tag='mon_undef2', label="UND ")
-                tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
+            # -------
+            # Status
+            # -------
+            status_height = 154
+            if DEBUG:
+                status_height = 180
+            with dpg.collapsing_header(label="Status", default_open=True):
+                dpg.add_child_window(tag='mon_status_container', height=status_height, border=False)
 
-                val += 1
-                dpg.add_button(tag='mon_tune_request', label=" TR ")
-                tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
+            with dpg.table(parent='mon_status_container', header_row=False, policy=dpg.mvTable_SizingFixedFit):
+                dpg.add_table_column(label="Title")
 
-                # FIXME: mido is missing EOX (TODO: send PR)
-                val += 1
-                with dpg.group(tag='mon_end_of_exclusive_common_grp'):
-                    dpg.add_button(
-                        tag='mon_end_of_exclusive_common', label="EOX "
-                        )
-                    tooltip_conv(midi_const.SYSTEM_COMMON_MESSAGES[val], val)
+                _add_table_columns(3)
 
-            with dpg.table_row():
-                dpg.add_text()
+                with dpg.table_row():
+                    dpg.add_text("Type")
 
-                dpg.add_text("Real-Time")
+                    dpg.add_button(tag='mon_c', label="CHANNEL")
+                    with dpg.tooltip(dpg.last_item()):
+                        dpg.add_text("Channel Message")
 
-                # System real time messages (page 30)
-                val = 0xF8
-                dpg.add_button(tag='mon_clock', label="CLK ")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+                    dpg.add_button(tag='mon_s', label="SYSTEM")
+                    with dpg.tooltip(dpg.last_item()):
+                        dpg.add_text("System Message")
 
-                # FIXME: unsupported by mido
-                val += 1
-                dpg.add_button(tag='mon_undef3', label="UND ")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+            hlen = 1  # Hexadecimal
+            dlen = 3  # Decimal
+            blen = 4  # Binary
 
-                val += 1
-                dpg.add_button(tag='mon_start', label="STRT")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+            with dpg.table(parent='mon_status_container', header_row=False, policy=dpg.mvTable_SizingFixedFit):
+                dpg.add_table_column(label="Title")
+                _add_table_columns(17)
 
-                val += 1
-                dpg.add_button(tag='mon_continue', label="CTNU")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+                with dpg.table_row():
+                    dpg.add_text("Channel")
 
-                val += 1
-                dpg.add_button(tag='mon_stop', label="STOP")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+                    for channel in range(16):
+                        dpg.add_button(tag=CHANNELS_TAGS[channel], label=CHANNELS_LABELS[channel])
+                        tooltip_conv(CHANNELS_TITLES[channel], channel, hlen, dlen, blen)
 
-                # FIXME: unsupported by mido
-                val += 1
-                dpg.add_button(tag='mon_undef4', label="UND ")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+            with dpg.table(parent='mon_status_container', header_row=False, policy=dpg.mvTable_SizingFixedFit):
+                dpg.add_table_column(label="Title")
 
-                val += 1
-                dpg.add_button(tag='mon_active_sensing', label=" AS ")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+                _add_table_columns(9)
 
-                val += 1
-                dpg.add_button(tag='mon_reset', label="RST ")
-                tooltip_conv(midi_const.SYSTEM_REAL_TIME_MESSAGES[val], val)
+                with dpg.table_row():
+                    dpg.add_text("Channel Messages")
 
-            with dpg.table_row():
-                dpg.add_text()
+                    dpg.add_text("Voice")
 
-                dpg.add_text("Exclusive")
+                    # Channel voice messages (page 9)
+                    for tag, label, val in CHANNEL_VOICE_BUTTONS:
+                        dpg.add_button(tag=tag, label=label)
+                        tooltip_conv(channel_voice_messages[val], val, hlen, dlen, blen)
 
-                # System exclusive messages
-                val = 0xF0
-                dpg.add_button(tag='mon_sysex', label="SOX ")
-                tooltip_conv(midi_const.SYSTEM_EXCLUSIVE_MESSAGES[val], val)
+                if DEBUG:
+                    # TODO: Channel mode messages (page 20) (CC 120-127)
+                    # TODO: add preference to separate reserved CC120-127
+                    with dpg.table_row():
+                        dpg.add_text()
 
-                # FIXME: mido is missing EOX (TODO: send PR)
-                val = 0xF7
-                with dpg.group(tag='mon_end_of_exclusive_syx_grp'):
-                    dpg.add_button(tag='mon_end_of_exclusive_syx', label="EOX ")
-                    tooltip_conv(midi_const.SYSTEM_EXCLUSIVE_MESSAGES[val], val)
+                        dpg.add_text("Mode")
 
-            _update_eox_category(sender=None, app_data=None, user_data=eox_categories)
+                        for tag, label, val in CHANNEL_MODE_BUTTONS:
+                            dpg.add_button(tag=tag, label=label)
+                            tooltip_conv(channel_mode_messages[val], val)
 
-        # ---------------
-        # Running Status
-        # ---------------
-        if DEBUG:
-            # TODO: implement
-            with dpg.collapsing_header(label="Running Status", default_open=False):
-                dpg.add_child_window(tag='mon_running_status_container', height=20, border=False)
-                # FIXME: unimplemented upstream (page A-1)
-                dpg.add_text("Not implemented yet", parent='mon_running_status_container')
-
-        # ------
-        # Notes
-        # ------
-        with dpg.collapsing_header(label="Notes", default_open=not DEBUG):
-            dpg.add_child_window(tag='mon_notes_container', height=180, border=False)
-
-        # TODO: Staff?
-        # dpg.add_child_window(parent='mon_notes_container', tag='staff', label="Staff", height=120, border=False)
-
-        # Keyboard
-        # TODO: Graphical
-        dpg.add_child_window(parent='mon_notes_container', tag='keyboard', label="Keyboard", height=180,
-                             border=False)
-
-        # TODO: add an intensity display for velocity?
-
-        width = 12  # Key width
-        height = 90  # Key height
-        margin = 1  # Margin between keys
-        bxpos = width / 2  # Black key X position
-        wxpos = 0  # White key X position
-
-        for index, name in notation_modes.get(dpg.get_value('notation_mode')).items():
-            # Compute actual key position
-            xpos = wxpos
-            ypos = height
-            if "#" in name:
-                height = ypos
-                xpos = bxpos
-                ypos = 0
-
-            label = _verticalize(name)
-
-            dpg.add_slider_int(
-                tag=f'note_{index}', parent='keyboard', width=width, height=height,
-                format=label,  # Used instead of label to display properly
-                pos=(xpos, ypos),
-                vertical=True,
-                min_value=0, max_value=127,
-                enabled=False,  # Required for theme color to apply properly
-            )
-
-            tooltip_conv(
-                f"English Alphabetical:\t{midiexplorer.midi.notes.MIDI_NOTES_ALPHA_EN[index]}\n"
-                f"Syllabic:{' ':12}\t{midiexplorer.midi.notes.MIDI_NOTES_SYLLABIC[index]}\n"
-                f"German Alphabetical: \t{midiexplorer.midi.notes.MIDI_NOTES_ALPHA_DE[index]}",
-                index, blen=7
-            )
-
-            # Next key position computation
-            if "#" not in name:
-                wxpos += width + margin
-            elif "D#" in name or "A#" in name:
-                bxpos += (width + margin) * 2
-            else:
-                bxpos += width + margin
+                for title, category, buttons, messages, eox_representation in SYSTEM_MESSAGES_ROWS:
+                    with dpg.table_row():
+                        dpg.add_text(title)
 
-        ###
-        # TODO: Polyphonic Key Pressure (Aftertouch)
-        ###
-        # Value timegraph
+                        dpg.add_text(category)
 
-        # ------------
-        # Controllers
-        # ------------
-        with dpg.collapsing_header(label="Controllers", default_open=not DEBUG):
-            dpg.add_child_window(tag='mon_controllers_container', height=400, border=False)
+                        for tag, label, val in buttons:
+                            dpg.add_button(tag=tag, label=label)
+                            tooltip_conv(messages[val], val)
 
-        with dpg.table(tag='mon_controllers', parent='mon_controllers_container', header_row=False,
-                       policy=dpg.mvTable_SizingFixedFit):
-            dpg.add_table_column(label="Title")
+                        if eox_representation is not None:
+                            # FIXME: mido is missing EOX (TODO: send PR)
+                            val = 0xF7
+                            with dpg.group(tag=f'mon_end_of_exclusive_{eox_representation}_grp'):
+                                dpg.add_button(tag=f'mon_end_of_exclusive_{eox_representation}', label="EOX ")
+                                tooltip_conv(messages[val], val)
 
-            for _i in range(17):
-                dpg.add_table_column()
+                _update_eox_category(sender=None, app_data=dpg.get_value('eox_category'), user_data=None)
 
-            num_controllers = 128
-            group_controllers_by = 8
-            rownum = 0
-            dpg.add_table_row(tag=f'ctrls_{rownum}', parent='mon_controllers')
-            #    dpg.add_text("Controllers")
-            #    dpg.add_text("")
-            # TODO: add preference to separate reserved CC120-127
-            for controller in range(num_controllers):
-                with dpg.group(horizontal=True, parent=f'ctrls_{rownum}'):
-                    dpg.add_button(
-                        tag=f'mon_cc_{controller}', label=f"{controller:3d}"
-                        )
-                    tooltip_conv(
-                        midi_const.CONTROLLER_NUMBERS[controller], controller,
-                        blen=7
-                        )
-                    dpg.add_input_text(
-                        tag=f'mon_cc_val_{controller}', enabled=False, width=50
-                        )
-                    with dpg.tooltip(dpg.last_item()):
-                        dpg.add_text(
-                            f"{midi_const.CONTROLLER_NUMBERS[controller]} Value:"
-                            )
-                        dpg.add_text(source=f'mon_cc_val_{controller}')
-                        # TODO: hex and bin realtime conversions
-                newrownum = (controller + 1) // group_controllers_by
-                if newrownum > rownum:
-                    rownum = newrownum
-                    dpg.add_table_row(
-                        tag=f'ctrls_{rownum}', parent='mon_controllers'
-                        )
-                    # dpg.add_text("", parent=f'ctrls_{rownum}')
-                    # dpg.add_text("", parent=f'ctrls_{rownum}')
-            del rownum
-
-        ###
-        # TODO: Per controller status
-        ###
-        # Value timegraph
-
-        ###
-        # TODO: Registered parameter decoding?
-        ###
-        # Value timegraph
+            # ---------------
+            # Running Status
+            # ---------------
+            if DEBUG:
+                # TODO: implement
+                with dpg.collapsing_header(label="Running Status", default_open=False):
+                    dpg.add_child_window(tag='mon_running_status_container', height=20, border=False)
+                    # FIXME: unimplemented upstream (page A-1)
+                    dpg.add_text("Not implemented yet", parent='mon_running_status_container')
+
+            # ------
+            # Notes
+            # ------
+            with dpg.collapsing_header(label="Notes", default_open=not DEBUG):
+                dpg.add_child_window(tag='mon_notes_container', height=180, border=False)
+
+            # TODO: Staff?
+            # dpg.add_child_window(parent='mon_notes_container', tag='staff', label="Staff", height=120, border=False)
+
+            # Keyboard
+            # TODO: Graphical
+            dpg.add_child_window(parent='mon_notes_container', tag='keyboard', label="Keyboard", height=180,
+                                 border=False)
+
+            # TODO: add an intensity display for velocity?
+
+            keys = zip(NOTES_TAGS, VERTICAL_NOTES_LABELS[default_notation_mode], KEYS_POSITIONS, NOTES_TOOLTIPS)
+            for index, (tag, label, position, tooltip) in enumerate(keys):
+                dpg.add_slider_int(
+                    tag=tag, parent='keyboard', width=KEY_WIDTH, height=KEY_HEIGHT,
+                    format=label,  # Used instead of label to display properly
+                    pos=position,
+                    vertical=True,
+                    min_value=0, max_value=127,
+                    enabled=False,  # Required for theme color to apply properly
+                )
 
-        # --------------
-        # Program change
-        # --------------
-        ###
-        # TODO: Bank Select?
-        #       Value timegraph
-        ###
-        mon_prog_height=70
-        if DEBUG:
-            mon_prog_height=120
+                tooltip_conv(tooltip, index, blen=7)
+
+            ###
+            # TODO: Polyphonic Key Pressure (Aftertouch)
+            ###
+            # Value timegraph
+
+            # ------------
+            # Controllers
+            # ------------
+            controllers_open = not DEBUG
+            with dpg.collapsing_header(tag='mon_controllers_header', label="Controllers",
+                                       default_open=controllers_open):
+                dpg.add_child_window(tag='mon_controllers_container', height=400, border=False)
+
+            # Deferred off the window opening critical path
+            if controllers_open:
+                dpg.set_frame_callback(2, _add_controllers)
+            else:  # Only when first expanded
+                with dpg.item_handler_registry(tag='mon_controllers_header_handlers'):
+                    dpg.add_item_toggled_open_handler(callback=_add_controllers)
+                dpg.bind_item_handler_registry('mon_controllers_header', 'mon_controllers_header_handlers')
+
+            ###
+            # TODO: Per controller status
+            ###
+            # Value timegraph
+
+            ###
+            # TODO: Registered parameter decoding?
+            ###
+            # Value timegraph
+
+            # --------------
+            # Program change
+            # --------------
+            ###
+            # TODO: Bank Select?
+            #       Value timegraph
+            ###
+            mon_prog_height=70
+            if DEBUG:
+                mon_prog_height=120
 
-        with dpg.collapsing_header(label="Program", default_open=True):
-            with dpg.child_window(tag='mon_program_container', height=mon_prog_height, border=False):
-                with dpg.group(horizontal=True):
-                    dpg.add_text("Num")
-                    dpg.add_input_text(source='pc_num', readonly=True, width=50)  # 0-127
-                if DEBUG:
+            with dpg.collapsing_header(label="Program", default_open=True):
+                with dpg.child_window(tag='mon_program_container', height=mon_prog_height, border=False):
                     with dpg.group(horizontal=True):
-                        dpg.add_text("Resource")
-                        # TODO: Autoset on receiving Defined Universal Sysex non real time
-                        dpg.add_combo(["GM", "GM2", "GS", "XG"], default_value="GM", fit_width=True)
-                        # TODO: Add logo
-                    with dpg.group(horizontal=True):  # TODO: Not GM modes only
-                        dpg.add_text("Bank")
-                        dpg.add_input_text(source='pc_bank_num', readonly=True, width=50)  # 0-16383
-                        dpg.add_input_text(source='pc_bank_name', readonly=True, width=250)
-                with dpg.group(horizontal=True):  # TODO: GM mode only
-                    dpg.add_text("Group")
-                    dpg.add_input_text(source='pc_group_name', readonly=True, width=250)
-                with dpg.group(horizontal=True):
-                    dpg.add_text("Name")
-                    dpg.add_input_text(source='pc_name', readonly=True, width=250)
-
-        ###
-        # TODO: Pitch bend change
-        ###
-        # Value timegraph
-
-        ###
-        # TODO: Channel Pressure (Aftertouch)
-        ###
-        # Value timegraph
-
-        ###
-        # TODO: System common
-        ###
-        # MTC Quarter Frame (Fully decode MTC status)
-        # Song Pos Pointer
-        # Song Select
-        # Tune Request
-        # EOX
-
-        ###
-        # TODO: System Realtime
-        ###
-        # Timing Clock (Compute BPM)
-        # Start
-        # Continue
-        # Stop
-        # Active Sensing
-        # System Reset
-
-        # -----------------
-        # System Exclusive
-        # -----------------
-        with dpg.collapsing_header(label="System Exclusive", default_open=not DEBUG):
-
-            with dpg.child_window(tag='mon_sysex_container', height=120, border=False):
-                with dpg.group():
+                        dpg.add_text("Num")
+                        dpg.add_input_text(source='pc_num', readonly=True, width=50)  # 0-127
+                    if DEBUG:
+                        with dpg.group(horizontal=True):
+                            dpg.add_text("Resource")
+                            # TODO: Autoset on receiving Defined Universal Sysex non real time
+                            dpg.add_combo(["GM", "GM2", "GS", "XG"], default_value="GM", fit_width=True)
+                            # TODO: Add logo
+                        with dpg.group(horizontal=True):  # TODO: Not GM modes only
+                            dpg.add_text("Bank")
+                            dpg.add_input_text(source='pc_bank_num', readonly=True, width=50)  # 0-16383
+                            dpg.add_input_text(source='pc_bank_name', readonly=True, width=250)
+                    with dpg.group(horizontal=True):  # TODO: GM mode only
+                        dpg.add_text("Group")
+                        dpg.add_input_text(source='pc_group_name', readonly=True, width=250)
                     with dpg.group(horizontal=True):
-                        title = "ID"
+                        dpg.add_text("Name")
+                        dpg.add_input_text(source='pc_name', readonly=True, width=250)
+
+            ###
+            # TODO: Pitch bend change
+            ###
+            # Value timegraph
+
+            ###
+            # TODO: Channel Pressure (Aftertouch)
+            ###
+            # Value timegraph
+
+            ###
+            # TODO: System common
+            ###
+            # MTC Quarter Frame (Fully decode MTC status)
+            # Song Pos Pointer
+            # Song Select
+            # Tune Request
+            # EOX
+
+            ###
+            # TODO: System Realtime
+            ###
+            # Timing Clock (Compute BPM)
+            # Start
+            # Continue
+            # Stop
+            # Active Sensing
+            # System Reset
+
+            # -----------------
+            # System Exclusive
+            # -----------------
+            with dpg.collapsing_header(label="System Exclusive", default_open=not DEBUG):
+
+                with dpg.child_window(tag='mon_sysex_container', height=120, border=False):
+                    with dpg.group():
+                        with dpg.group(horizontal=True):
+                            title = "ID"
+                            dpg.add_text(title)
+                            dpg.add_input_text(source='syx_id_region', readonly=True, width=200)
+                            tooltip_preconv(f"{title} (Region)", 'syx_id_region', 'syx_id_val')
+                            dpg.add_input_text(source='syx_id_group', readonly=True, width=200)
+                            tooltip_preconv(f"{title} (Group)", 'syx_id_group', 'syx_id_val')
+                            dpg.add_input_text(source='syx_id_name', readonly=True, width=200)
+                            tooltip_preconv(f"{title} (Name)", 'syx_id_name', 'syx_id_val')
+                        with dpg.group(horizontal=True):
+                            title = "Device ID"
+                            source = 'syx_device_id'
+                            dpg.add_text(title)
+                            dpg.add_input_text(source=source, readonly=True, width=50)
+                            tooltip_preconv(static_title=title, values_source=source)
+                        with dpg.group(horizontal=True, tag='syx_payload_container'):
+                            title = "Undecoded Payload"
+                            dpg.add_text(title)
+                            source = 'syx_payload'
+                            dpg.add_input_text(source=source, readonly=True, width=500)
+                            tooltip_preconv(static_title=title, values_source=source)
+
+                    with dpg.group(tag='syx_decoded_payload', show=False):
+                        title = "Decoded Payload"
                         dpg.add_text(title)
-                        dpg.add_input_text(source='syx_id_region', readonly=True, width=200)
-                        tooltip_preconv(f"{title} (Region)", 'syx_id_region', 'syx_id_val')
-                        dpg.add_input_text(source='syx_id_group', readonly=True, width=200)
-                        tooltip_preconv(f"{title} (Group)", 'syx_id_group', 'syx_id_val')
-                        dpg.add_input_text(source='syx_id_name', readonly=True, width=200)
-                        tooltip_preconv(f"{title} (Name)", 'syx_id_name', 'syx_id_val')
-                    with dpg.group(horizontal=True):
-                        title = "Device ID"
-                        source = 'syx_device_id'
-                        dpg.add_text(title)
-                        dpg.add_input_text(source=source, readonly=True, width=50)
-                        tooltip_preconv(static_title=title, values_source=source)
-                    with dpg.group(horizontal=True, tag='syx_payload_container'):
-                        title = "Undecoded Payload"
-                        dpg.add_text(title)
-                        source = 'syx_payload'
-                        dpg.add_input_text(source=source, readonly=True, width=500)
-                        tooltip_preconv(static_title=title, values_source=source)
+                        tooltip_preconv(static_title=title, values_source='syx_payload')
 
-                with dpg.group(tag='syx_decoded_payload', show=False):
-                    title = "Decoded Payload"
+            # TODO: generate dynamically?
+            with dpg.group(parent='syx_decoded_payload'):
+                with dpg.group(horizontal=True, tag='syx_sub_id1'):
+                    title = "Sub-ID#1"
+                    dpg.add_text(title)
+                    dpg.add_input_text(source='syx_sub_id1_name', readonly=True, width=250)
+                    tooltip_preconv(title, 'syx_sub_id1_name', 'syx_sub_id1_val')
+                with dpg.group(horizontal=True, tag='syx_sub_id2'):
+                    title = "Sub-ID#2"
                     dpg.add_text(title)
-                    tooltip_preconv(static_title=title, values_source='syx_payload')
-
-        # TODO: generate dynamically?
-        with dpg.group(parent='syx_decoded_payload'):
-            with dpg.group(horizontal=True, tag='syx_sub_id1'):
-                title = "Sub-ID#1"
-                dpg.add_text(title)
-                dpg.add_input_text(source='syx_sub_id1_name', readonly=True, width=250)
-                tooltip_preconv(title, 'syx_sub_id1_name', 'syx_sub_id1_val')
-            with dpg.group(horizontal=True, tag='syx_sub_id2'):
-                title = "Sub-ID#2"
-                dpg.add_text(title)
-                dpg.add_input_text(source='syx_sub_id2_name', readonly=True, width=250)
-                tooltip_preconv(title, 'syx_sub_id2_name', 'syx_sub_id2_val')
+                    dpg.add_input_text(source='syx_sub_id2_name', readonly=True, width=250)
+                    tooltip_preconv(title, 'syx_sub_id2_name', 'syx_sub_id2_val')
 
 
 def toggle(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
@@ -7,65 +7,79 @@
 """
 Monitoring blinking buttons.
 """
-import functools
 import time
+from typing import Any, Optional
 
 from dearpygui import dearpygui as dpg
 
 from midiexplorer.__config__ import DEBUG
-from midiexplorer.midi.timestamp import Timestamp
+from midiexplorer.gui.helpers.callbacks.debugging import (
+    enable as enable_dpg_cb_debugging
+)
+
+# Indicators themes, created once with the monitor window.
+ACT_THEME = '__act'
+FORCE_ACT_THEME = '__force_act'
+
+# Indicators tags, built once to spare formatting them for each MIDI message.
+CHANNELS_TAGS = tuple(f'mon_{channel}' for channel in range(16))
+CONTROLLERS_TAGS = tuple(f'mon_cc_{controller}' for controller in range(128))
+CONTROLLERS_VALUES_TAGS = tuple(f'mon_cc_val_{controller}' for controller in range(128))
+CONTROLLERS_TAGS_SET = frozenset(CONTROLLERS_TAGS)
+NOTES_TAGS = tuple(f'note_{index}' for index in range(128))
+
+# DPG functions used in the blinking hot paths, bound once to spare the module attribute lookups.
+_bind_item_theme = dpg.bind_item_theme
+
+###
+# GLOBAL VARIABLES
+###
+# Currently lit indicators and the time until they should stay lit (Monotonic performance counter seconds).
+# Kept Python side to spare polling every supported indicator through DPG each frame.
+lit_indicators: dict[str, float] = {}
+# Lower bound of the lit indicators expiry times (seconds).
+# Allows skipping the per-frame scan until something may have expired.
+next_expiry: float = float('inf')
+# Keyboard notes not in their default (disabled and zeroed) state.
+# Allows resetting only those instead of the whole keyboard for each MIDI message.
+touched_notes: set[int] = set()
+# Mirror of the 'mon_blink_duration' setting (seconds).
+# Updated by its widget callback to spare a DPG lookup for each MIDI message.
+blink_duration: float = .25
+# Controllers table state. The table is built lazily so values received before are kept here to seed it.
+controllers_created: bool = False
+controllers_values: list[int | str] = [""] * 128
+
+
+def update_blink_duration(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
+    """Callback to update the blink duration setting mirror.
+
+    :param sender: argument is used by DPG to inform the callback
+                   which item triggered the callback by sending the tag
+                   or 0 if trigger by the application.
+    :param app_data: argument is used DPG to send information to the callback
+                     i.e. the current value of most basic widgets.
+    :param user_data: argument is Optionally used to pass your own python data into the function.
 
+    """
+    global blink_duration
+
+    if DEBUG:
+        enable_dpg_cb_debugging(sender, app_data, user_data)
+
+    blink_duration = app_data
 
-@functools.lru_cache()  # Only compute once
-def get_supported_indicators() -> list:
-    """Cached list of supported indicators.
 
-    :return: list of indicators.
+def _get_theme_targets(indicator: str) -> tuple[str, ...]:
+    """Items to theme when blinking an indicator.
+
+    :param indicator: Indicator tag.
+    :return: tuple of item tags.
     """
-    mon_indicators = [
-        'mon_c',
-        'mon_s',
-        'mon_note_off',
-        'mon_note_on',
-        'mon_polytouch',
-        'mon_control_change',
-        'mon_program_change',
-        'mon_aftertouch',
-        'mon_pitchwheel',
-        'mon_sysex',
-        'mon_quarter_frame',
-        'mon_songpos',
-        'mon_song_select',
-        'mon_tune_request',
-        'mon_end_of_exclusive',
-        'mon_clock',
-        'mon_start',
-        'mon_continue',
-        'mon_stop',
-        'mon_active_sensing',
-        'mon_reset'
-    ]
-    for channel in range(16):
-        mon_indicators.append(f'mon_{channel}')
-    for controller in range(128):
-        mon_indicators.append(f'mon_cc_{controller}')
-    if DEBUG:  # Experimental
-        mon_indicators.extend([
-            'mon_undef1',
-            'mon_undef2',
-            'mon_undef3',
-            'mon_undef4',
-            'mon_all_sound_off',
-            'mon_reset_all_controllers',
-            'mon_local_control',
-            'mon_all_notes_off',
-            'mon_omni_off',
-            'mon_omni_on',
-            'mon_mono_on',
-            'mon_poly_on'
-        ])
-
-    return mon_indicators
+    # EOX is a special case since we have two alternate representations.
+    if indicator != 'mon_end_of_exclusive':
+        return indicator,
+    return 'mon_end_of_exclusive_common', 'mon_end_of_exclusive_syx'
 
 
 def get_supported_decoders() -> list:
@@ -88,13 +102,11 @@ def get_supported_decoders() -> list:
 
 
 def get_theme(static, disable: bool = False):
-    if not static and not disable:
-        theme = '__act'
-    elif not static and disable:
-        theme = None
-    else:
-        theme = '__force_act'
-    return theme
+    if static:
+        return FORCE_ACT_THEME
+    if disable:
+        return None
+    return ACT_THEME
 
 
 def mon(indicator: int | str, static: bool = False) -> None:
@@ -107,26 +119,55 @@ def mon(indicator: int | str, static: bool = False) -> None:
     # logger = midiexplorer.gui.logger.Logger()
     # logger.log_debug(f"blink {indicator}")
 
-    now = time.perf_counter() - Timestamp.START_TIME
-    delay = dpg.get_value('mon_blink_duration')
-    target = f'mon_{indicator}_active_until'
+    _light(f'mon_{indicator}', static)
+
+
+def _set_lit(target: str, static: bool = False) -> None:
+    """Records an indicator as lit for its lifetime management.
+
+    :param target: Tag of the indicator to blink.
+    :param static: Live or static mode.
+
+    """
+    global next_expiry
+
+    now = time.perf_counter()
     if not static:
-        until = now + delay
+        until = now + blink_duration
     else:
         until = float('inf')
-    dpg.set_value(target, until)
+    with dpg.mutex():  # Consistent with the expiry recomputation in update_mon_status()
+        lit_indicators[target] = until
+        if until < next_expiry:
+            next_expiry = until
+
+
+def _light(target: str, static: bool = False) -> None:
+    """Illuminates an indicator from its tag.
+
+    :param target: Tag of the indicator to blink.
+    :param static: Live or static mode.
+
+    """
+    _set_lit(target, static)
     theme = get_theme(static)
-    # EOX special case since we have two alternate representations.
-    if indicator != 'end_of_exclusive':
-        dpg.bind_item_theme(f'mon_{indicator}', theme)
-    else:
-        dpg.bind_item_theme(f'mon_{indicator}_common', theme)
-        dpg.bind_item_theme(f'mon_{indicator}_syx', theme)
-    # logger.log_debug(f"Current time:{time.perf_counter() - Timestamp.START_TIME}")
-    # logger.log_debug(f"Blink {delay} until: {dpg.get_value(target)}")
+    for theme_target in _get_theme_targets(target):
+        _bind_item_theme(theme_target, theme)
+    # logger.log_debug(f"Current time:{time.perf_counter()}")
+    # logger.log_debug(f"Blink {delay} until: {lit_indicators[target]}")
+
 
+def channel(number: int, static: bool = False) -> None:
+    """Illuminates the channel.
 
-def note_on(number: int | str, static: bool = False, velocity: int = None) -> None:
+    :param number: MIDI channel number.
+    :param static: Live or static mode.
+
+    """
+    _light(CHANNELS_TAGS[number], static)
+
+
+def note_on(number: int, static: bool = False, velocity: int = None) -> None:
     """Illuminates the note.
 
     :param number: MIDI note number.
@@ -134,38 +175,75 @@ def note_on(number: int | str, static: bool = False, velocity: int = None) -> No
     :param velocity: Note velocity
 
     """
-    dpg.enable_item(f'note_{number}')
+    tag = NOTES_TAGS[number]
+    touched_notes.add(number)
+    dpg.enable_item(tag)
     if velocity is not None:
-        dpg.set_value(f'note_{number}', velocity)
+        dpg.set_value(tag, velocity)
 
 
-def note_off(number: int | str, static: bool = False) -> None:
+def note_off(number: int, static: bool = False) -> None:
     """Darken the note.
 
     :param number: MIDI note number.
     :param static: Live or static mode.
 
     """
+    tag = NOTES_TAGS[number]
     if static:
-        dpg.enable_item(f'note_{number}')
+        touched_notes.add(number)
+        dpg.enable_item(tag)
     else:
-        dpg.disable_item(f'note_{number}')
-    dpg.set_value(f'note_{number}', 0)
+        touched_notes.discard(number)
+        dpg.disable_item(tag)
+    dpg.set_value(tag, 0)
+
 
+def cc(number: int, value: int | str, static: bool = False) -> None:
+    """Illuminates the controller and displays its value.
 
-def cc(number: int | str, value: int | str, static: bool = False) -> None:
-    mon(f'cc_{number}', static)
-    dpg.set_value(f'mon_cc_val_{number}', value)
+    :param number: MIDI controller number.
+    :param value: Controller value.
+    :param static: Live or static mode.
 
+    """
+    # Same lock as the table creation: a value is either seeded by it or set on the built table
+    with dpg.mutex():
+        controllers_values[number] = value
+        if not controllers_created:  # Displayed once the table is built
+            _set_lit(CONTROLLERS_TAGS[number], static)
+            return
+        _light(CONTROLLERS_TAGS[number], static)
+        dpg.set_value(CONTROLLERS_VALUES_TAGS[number], value)
 
-def _reset_indicator(indicator):
-    # EOX is a special case since we have two alternate representations.
-    if indicator != 'mon_end_of_exclusive':
-        dpg.bind_item_theme(f'{indicator}', None)
-    else:
-        dpg.bind_item_theme(f'{indicator}_common', None)
-        dpg.bind_item_theme(f'{indicator}_syx', None)
-    dpg.set_value(f'{indicator}_active_until', 0.0)
+
+def set_controllers_created() -> None:
+    """Marks the controllers table as built and displays the controllers received before.
+
+    Must be called under the same DPG mutex hold as the table creation.
+
+    """
+    global controllers_created
+
+    controllers_created = True
+    for tag, value_tag, value in zip(CONTROLLERS_TAGS, CONTROLLERS_VALUES_TAGS, controllers_values):
+        dpg.set_value(value_tag, value)
+        until = lit_indicators.get(tag)
+        if until is not None:
+            _bind_item_theme(tag, get_theme(until == float('inf')))
+
+
+def _reset_indicator(indicator: str) -> None:
+    """Darkens an indicator.
+
+    :param indicator: Indicator tag.
+
+    """
+    lit_indicators.pop(indicator, None)
+    if not controllers_created and indicator in CONTROLLERS_TAGS_SET:  # Not built yet: nothing to darken
+        return
+    for target in _get_theme_targets(indicator):
+        _bind_item_theme(target, None)
 
 
 def update_mon_status() -> None:
@@ -174,26 +252,37 @@ def update_mon_status() -> None:
     Checks for the time it should stay illuminated and darkens it if expired.
 
     """
-    now = time.perf_counter() - Timestamp.START_TIME
-    for indicator in get_supported_indicators():
-        value = dpg.get_value(f'{indicator}_active_until')
-        if value:  # Prevent resetting theme when not needed.
-            if value < now:
-                _reset_indicator(indicator)
+    global next_expiry
+
+    if not lit_indicators:  # Idle: nothing to darken
+        return
+    now = time.perf_counter()
+    if now <= next_expiry:  # Nothing expired yet
+        return
+    with dpg.mutex():  # Indicators are also lit from the DPG callbacks thread
+        expired = [indicator for indicator, until in lit_indicators.items() if until < now]
+        for indicator in expired:
+            _reset_indicator(indicator)
+        next_expiry = min(lit_indicators.values(), default=float('inf'))
 
 
 def reset_mon(static: bool = False) -> None:
-    # FIXME: add a data structure caching the currently lit indicators to only process those needed
-    for indicator in get_supported_indicators():
-        if not static or dpg.get_value(f'{indicator}_active_until') == float('inf'):
+    # Only process the currently lit indicators
+    for indicator, until in list(lit_indicators.items()):
+        if not static or until == float('inf'):
             _reset_indicator(indicator)
 
-    for note_number in range(0, 128):  # All MIDI notes
+    if static:  # Darkening: untouched notes are already dark
+        note_numbers = tuple(touched_notes)
+    else:
+        note_numbers = range(0, 128)  # All MIDI notes
+    with dpg.mutex():  # Lock once for all the keyboard updates
+        for note_number in note_numbers:
             note_off(note_number, not static)
 
     if not static:
         for decoder in get_supported_decoders():
-            dpg.set_value(f'{decoder}', "")
+            dpg.set_value(decoder, "")
         # SysEx dynamic display
         dpg.hide_item('syx_decoded_payload')
         dpg.show_item('syx_payload_container')
@@ -7,17 +7,49 @@
 """
 Monitor data management.
 """
+from typing import Any, Optional
+
 import midi_const
 import mido
 from dearpygui import dearpygui as dpg
 from midi_const import NOTE_OFF_VELOCITY
 
+from midiexplorer.__config__ import DEBUG
+from midiexplorer.gui.helpers.callbacks.debugging import (
+    enable as enable_dpg_cb_debugging
+)
 from midiexplorer.gui.helpers.convert import set_value_preconv
-from midiexplorer.gui.windows.mon.blink import cc, mon, note_off, note_on, \
-    reset_mon
+from midiexplorer.gui.windows.mon.blink import cc, channel, mon, note_off, \
+    note_on, reset_mon
 from midiexplorer.midi.decoders.sysex import DecodedSysEx, \
     DecodedUniversalSysExPayload
 
+###
+# GLOBAL VARIABLES
+###
+# Mirror of the 'zero_velocity_note_on_is_note_off' setting.
+# Updated by its widget callback to spare DPG lookups for each note message.
+zero_velocity_note_on_is_note_off: bool = True
+
+
+def update_zero_velocity_note_on_is_note_off(sender: int | str, app_data: Any, user_data: Optional[Any]) -> None:
+    """Callback to update the zero velocity note on setting mirror.
+
+    :param sender: argument is used by DPG to inform the callback
+                   which item triggered the callback by sending the tag
+                   or 0 if trigger by the application.
+    :param app_data: argument is used DPG to send information to the callback
+                     i.e. the current value of most basic widgets.
+    :param user_data: argument is Optionally used to pass your own python data into the function.
+
+    """
+    global zero_velocity_note_on_is_note_off
+
+    if DEBUG:
+        enable_dpg_cb_debugging(sender, app_data, user_data)
+
+    zero_velocity_note_on_is_note_off = app_data
+
 
 def _update_gui_sysex(decoded: DecodedSysEx):
     """Populate decoded system exclusive values in the GUI.
@@ -67,18 +99,17 @@ def update_gui_monitor(data: mido.Message, static: bool = False) -> None:
     # Channel
     if hasattr(data, 'channel'):
         mon('c', static)  # CHANNEL
-        mon(data.channel, static)  # Channel #
+        channel(data.channel, static)  # Channel #
     else:
         mon('s', static)  # SYSTEM
 
     # Data 1 & 2
     if 'note' in data.type:
-        if dpg.get_value('zero_velocity_note_on_is_note_off') and data.velocity == NOTE_OFF_VELOCITY:
+        zero_velocity_note_off = zero_velocity_note_on_is_note_off and data.velocity == NOTE_OFF_VELOCITY
+        if zero_velocity_note_off:
             mon('note_off', static)
         # Keyboard
-        if 'on' in data.type and not (
-                dpg.get_value('zero_velocity_note_on_is_note_off') and data.velocity == NOTE_OFF_VELOCITY
-        ):
+        if 'on' in data.type and not zero_velocity_note_off:
             note_on(data.note, static, data.velocity)
         else:
             note_off(data.note, static)
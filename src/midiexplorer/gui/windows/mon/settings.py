@@ -19,3 +19,5 @@ notation_modes = {
     "Syllabic": midiexplorer.midi.notes.MIDI_NOTES_SYLLABIC,
     "German Alphabetic ": midiexplorer.midi.notes.MIDI_NOTES_ALPHA_DE,
 }
+notation_modes_names = tuple(notation_modes.keys())
+default_notation_mode = notation_modes_names[0]
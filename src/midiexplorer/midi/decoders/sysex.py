@@ -28,6 +28,45 @@ import midi_const
 import mido
 
 
+def _flatten_ids(ids: dict) -> dict[int | tuple[int, int, int], str]:
+    """Flattens the nested system exclusive IDs names.
+
+    :param ids: 1-byte IDs names and 3-bytes IDs names nested by byte.
+    :return: IDs names by 1-byte value or 3-bytes tuple.
+    """
+    flat_ids = {}
+    for first_byte, names in ids.items():
+        if isinstance(names, dict):
+            for second_byte, third_byte_names in names.items():
+                for third_byte, name in third_byte_names.items():
+                    flat_ids[(first_byte, second_byte, third_byte)] = name
+        else:
+            flat_ids[first_byte] = names
+    return flat_ids
+
+
+# A single lookup for both IDs lengths
+SYSTEM_EXCLUSIVE_ID_NAMES = _flatten_ids(midi_const.SYSTEM_EXCLUSIVE_ID)
+
+
+def _flatten_sub_ids(sub_ids_2_from_1: dict) -> dict[tuple[int, int], str]:
+    """Flattens the universal system exclusive Sub-ID#2 names nested by Sub-ID#1.
+
+    :param sub_ids_2_from_1: Sub-ID#2 names by Sub-ID#1.
+    :return: Sub-ID#2 names by (Sub-ID#1, Sub-ID#2).
+    """
+    return {
+        (sub_id1, sub_id2): name
+        for sub_id1, names in sub_ids_2_from_1.items()
+        for sub_id2, name in names.items()
+    }
+
+
+# A single lookup for both sub-IDs
+NON_REAL_TIME_SUB_ID_2_NAMES = _flatten_sub_ids(midi_const.NON_REAL_TIME_SUB_ID_2_FROM_1)
+REAL_TIME_SUB_ID_2_NAMES = _flatten_sub_ids(midi_const.REAL_TIME_SUB_ID_2_FROM_1)
+
+
 class DecodedSysExId:
     def __init__(self, value: int | tuple[int]):
         length: int
@@ -77,17 +116,7 @@ class DecodedSysExId:
 
     @functools.cached_property
     def name(self) -> str:
-        name: str = "Undefined"
-        if self._len == 1:
-            name = midi_const.SYSTEM_EXCLUSIVE_ID.get(self._raw, "Undefined")
-        else:
-            name = midi_const.SYSTEM_EXCLUSIVE_ID.get(
-                self._raw[0], {}
-            ).get(
-                self._raw[1], {}
-            ).get(
-                self._raw[2], name
-            )
+        name: str = SYSTEM_EXCLUSIVE_ID_NAMES.get(self._raw, "Undefined")
         return name
 
 
@@ -131,10 +160,8 @@ class DecodedUniversalNonRealTimeSysExPayload(DecodedUniversalSysExPayload):
         if self.sub_id1_value in midi_const.NON_REAL_TIME_SUB_ID_2_FROM_1:
             next_byte += 1
             self.sub_id2_value = self._raw[next_byte]
-            self.sub_id2_name = midi_const.NON_REAL_TIME_SUB_ID_2_FROM_1.get(
-                self.sub_id1_value
-                ).get(
-                self.sub_id2_value, "Undefined"
+            self.sub_id2_name = NON_REAL_TIME_SUB_ID_2_NAMES.get(
+                (self.sub_id1_value, self.sub_id2_value), "Undefined"
             )
 
 
@@ -152,10 +179,8 @@ class DecodedUniversalRealTimeSysExPayload(DecodedUniversalSysExPayload):
         if self.sub_id1_value in midi_const.REAL_TIME_SUB_ID_2_FROM_1:
             next_byte += 1
             self.sub_id2_value = self._raw[next_byte]
-            self.sub_id2_name = midi_const.REAL_TIME_SUB_ID_2_FROM_1.get(
-                self.sub_id1_value
-                ).get(
-                self.sub_id2_value, "Undefined"
+            self.sub_id2_name = REAL_TIME_SUB_ID_2_NAMES.get(
+                (self.sub_id1_value, self.sub_id2_value), "Undefined"
             )
 
 
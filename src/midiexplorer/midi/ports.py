@@ -16,6 +16,7 @@ from functools import cached_property
 
 import mido
 
+from midiexplorer.__config__ import DEBUG
 from midiexplorer.gui.helpers.logger import Logger
 from midiexplorer.midi.timestamp import Timestamp
 
@@ -160,8 +161,8 @@ class MidiInPort(MidiPort):
         # Get the system timestamp ASAP
         timestamp = Timestamp()
 
-        logger = Logger()
-        logger.log_debug(f"Callback data: {midi_message} from {self.label} to {self.dest}")
+        if DEBUG:
+            Logger().log_debug(f"Callback data: {midi_message} from {self.label} to {self.dest}")
 
         with midi_in_lock:
             midi_in_queue.put((timestamp, self.label, self.dest, midi_message))
@@ -0,0 +1,69 @@
+# This Python file uses the following encoding: utf-8
+#
+# SPDX-FileCopyrightText: 2022 Raphaël Doursenaud <rdoursenaud@free.fr>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Monitor blinking tests.
+"""
+
+import pytest
+
+dpg = pytest.importorskip('dearpygui.dearpygui')
+blink = pytest.importorskip('midiexplorer.gui.windows.mon.blink')
+
+
+@pytest.fixture
+def context(monkeypatch):
+    """DPG context with the indicators themes and a pristine blinking state."""
+    monkeypatch.setattr(blink, 'controllers_created', False)
+    monkeypatch.setattr(blink, 'controllers_values', [""] * 128)
+    monkeypatch.setattr(blink, 'lit_indicators', {})
+    monkeypatch.setattr(blink, 'next_expiry', float('inf'))
+    dpg.create_context()
+    dpg.add_theme(tag=blink.ACT_THEME)
+    dpg.add_theme(tag=blink.FORCE_ACT_THEME)
+    yield
+    dpg.destroy_context()
+
+
+def _build_controllers() -> None:
+    """Builds the controllers widgets like the monitor window does."""
+    with dpg.window():
+        for tag, value_tag in zip(blink.CONTROLLERS_TAGS, blink.CONTROLLERS_VALUES_TAGS):
+            dpg.add_button(tag=tag)
+            dpg.add_input_text(tag=value_tag, enabled=False)
+
+
+def test_cc_before_build_is_displayed(context):
+    blink.cc(7, "42", static=True)
+
+    with dpg.mutex():
+        _build_controllers()
+        blink.set_controllers_created()
+
+    assert dpg.get_value(blink.CONTROLLERS_VALUES_TAGS[7]) == "42"
+    assert blink.lit_indicators[blink.CONTROLLERS_TAGS[7]] == float('inf')
+
+
+def test_cc_during_build_is_displayed(context):
+    with dpg.mutex():
+        _build_controllers()
+        blink.cc(9, "99")  # Arrives after the widgets exist but before the table is marked built
+        assert dpg.get_value(blink.CONTROLLERS_VALUES_TAGS[9]) == ""
+        blink.set_controllers_created()
+
+    assert dpg.get_value(blink.CONTROLLERS_VALUES_TAGS[9]) == "99"
+    assert blink.CONTROLLERS_TAGS[9] in blink.lit_indicators
+
+
+def test_cc_after_build_is_displayed(context):
+    with dpg.mutex():
+        _build_controllers()
+        blink.set_controllers_created()
+
+    blink.cc(11, "64")
+
+    assert dpg.get_value(blink.CONTROLLERS_VALUES_TAGS[11]) == "64"
+    assert blink.CONTROLLERS_TAGS[11] in blink.lit_indicators